@@ -26,22 +26,21 @@ from .const import (
     LOGGER,
 )
 from .coordinator import OstromPriceCoordinator
-from .utils import get_cheapest_3h_block, get_cheapest_4h_block
+from .utils import get_cheapest_block_start
 
 
 def _is_cheapest_3h_block_active(
-    slots: list[dict[str, Any]], now: datetime
+    block_start: datetime | None, now: datetime
 ) -> tuple[bool, datetime | None, datetime | None]:
     """Check if current time is within the cheapest 3-hour block.
 
     Args:
-        slots: List of price slots for today or tomorrow
+        block_start: Start of the cheapest 3-hour block for today or tomorrow
         now: Current datetime
 
     Returns:
         Tuple of (is_active, block_start, block_end)
     """
-    block_start = get_cheapest_3h_block(slots)
     if not block_start:
         return (False, None, None)
 
@@ -55,18 +54,17 @@ def _is_cheapest_3h_block_active(
 
 
 def _is_cheapest_4h_block_active(
-    slots: list[dict[str, Any]], now: datetime
+    block_start: datetime | None, now: datetime
 ) -> tuple[bool, datetime | None, datetime | None]:
     """Check if current time is within the cheapest 4-hour block.
 
     Args:
-        slots: List of price slots for today or tomorrow
+        block_start: Start of the cheapest 4-hour block for today or tomorrow
         now: Current datetime
 
     Returns:
         Tuple of (is_active, block_start, block_end)
     """
-    block_start = get_cheapest_4h_block(slots)
     if not block_start:
         return (False, None, None)
 
@@ -88,8 +86,9 @@ def _is_today_cheapest_3h_block_active(
         Tuple of (is_active, attributes_dict)
     """
     now = dt_util.now()
-    today_slots = data.get("today_slots", [])
-    is_active, block_start, block_end = _is_cheapest_3h_block_active(today_slots, now)
+    is_active, block_start, block_end = _is_cheapest_3h_block_active(
+        get_cheapest_block_start(data, "today", 3), now
+    )
 
     attrs = None
     if block_start:
@@ -110,8 +109,9 @@ def _is_today_cheapest_4h_block_active(
         Tuple of (is_active, attributes_dict)
     """
     now = dt_util.now()
-    today_slots = data.get("today_slots", [])
-    is_active, block_start, block_end = _is_cheapest_4h_block_active(today_slots, now)
+    is_active, block_start, block_end = _is_cheapest_4h_block_active(
+        get_cheapest_block_start(data, "today", 4), now
+    )
 
     attrs = None
     if block_start:
@@ -139,7 +139,7 @@ def _is_tomorrow_cheapest_3h_block_active(
         return (False, None)
 
     # Always calculate the block start/end for attributes, even if we're not in tomorrow yet
-    block_start = get_cheapest_3h_block(tomorrow_slots)
+    block_start = get_cheapest_block_start(data, "tomorrow", 3)
     if not block_start:
         return (False, None)
 
@@ -19,7 +19,11 @@ from .const import (
     LOGGER,
     RESOLUTION_HOUR,
 )
-from .utils import calculate_next_update_time
+from .utils import (
+    calculate_next_update_time,
+    get_cheapest_blocks,
+    get_price_stats,
+)
 
 RETRY_ON_ERROR_SECONDS = 120  # 2 Minuten bei Fehler erneut versuchen
 
@@ -135,6 +139,8 @@ class OstromPriceCoordinator(OstromBaseCoordinator):
     - today_slots: List of price slots for today
     - tomorrow_slots: List of price slots for tomorrow
     - current_slot: The slot covering the current time
+    - today_cheapest_blocks / tomorrow_cheapest_blocks: Cheapest block start per block length
+    - today_price_stats / tomorrow_price_stats: Price statistics and cheapest/most expensive hour
     """
 
     def __init__(
@@ -203,10 +209,8 @@ class OstromPriceCoordinator(OstromBaseCoordinator):
                 # Parse the date from API response
                 slot_start_str = entry.get("date", "")
                 try:
-                    # API returns UTC time
-                    slot_start_utc = datetime.fromisoformat(
-                        slot_start_str.replace("Z", "+00:00")
-                    )
+                    # API returns UTC time; fromisoformat handles the "Z" suffix
+                    slot_start_utc = datetime.fromisoformat(slot_start_str)
                     # Convert to local time
                     slot_start = slot_start_utc.astimezone(local_tz)
                 except (ValueError, TypeError) as err:
@@ -256,6 +260,11 @@ class OstromPriceCoordinator(OstromBaseCoordinator):
                 "today_slots": today_slots,
                 "tomorrow_slots": tomorrow_slots,
                 "current_slot": current_slot,
+                # Computed once per refresh and shared by all entities
+                "today_cheapest_blocks": get_cheapest_blocks(today_slots, (3, 4)),
+                "tomorrow_cheapest_blocks": get_cheapest_blocks(tomorrow_slots, (3, 4)),
+                "today_price_stats": get_price_stats(today_slots),
+                "tomorrow_price_stats": get_price_stats(tomorrow_slots),
                 "last_update": now,
             }
 
@@ -365,10 +374,8 @@ class OstromConsumptionCoordinator(OstromBaseCoordinator):
                 # Parse the date from API response
                 slot_start_str = entry.get("date", "")
                 try:
-                    # API returns UTC time
-                    slot_start_utc = datetime.fromisoformat(
-                        slot_start_str.replace("Z", "+00:00")
-                    )
+                    # API returns UTC time; fromisoformat handles the "Z" suffix
+                    slot_start_utc = datetime.fromisoformat(slot_start_str)
                     # Convert to local time
                     slot_start = slot_start_utc.astimezone(local_tz)
                 except (ValueError, TypeError) as err:
@@ -30,7 +30,7 @@ from .const import (
     LOGGER,
 )
 from .coordinator import OstromConsumptionCoordinator, OstromPriceCoordinator
-from .utils import get_cheapest_3h_block
+from .utils import get_cheapest_block_start, get_price_stat
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -50,145 +50,76 @@ def _get_current_price(data: dict[str, Any]) -> float | None:
     return None
 
 
-# Generic helper functions for price calculations
-def _get_min_price(slots: list[dict[str, Any]]) -> float | None:
-    """Get minimum price from slots (generic for today/tomorrow)."""
-    if not slots:
-        return None
-    # Treat None values and missing total_price as 0
-    prices = [s.get("total_price", 0) or 0 for s in slots]
-    return round(min(prices), 5) if prices else None
-
-
-def _get_max_price(slots: list[dict[str, Any]]) -> float | None:
-    """Get maximum price from slots (generic for today/tomorrow)."""
-    if not slots:
-        return None
-    prices = [s.get("total_price", 0) for s in slots]
-    return round(max(prices), 5) if prices else None
-
-
-def _get_avg_price(slots: list[dict[str, Any]]) -> float | None:
-    """Get average price from slots (generic for today/tomorrow)."""
-    if not slots:
-        return None
-    prices = [s.get("total_price", 0) for s in slots]
-    return round(sum(prices) / len(prices), 5) if prices else None
-
-
-def _get_median_price(slots: list[dict[str, Any]]) -> float | None:
-    """Get median price from slots (generic for today/tomorrow)."""
-    if not slots:
-        return None
-    prices = [s.get("total_price", 0) for s in slots]
-    if not prices:
-        return None
-
-    # Sort prices
-    sorted_prices = sorted(prices)
-    length = len(sorted_prices)
-
-    # Calculate median
-    if length % 2 == 1:
-        # Odd number of elements: return middle element
-        median = sorted_prices[length // 2]
-    else:
-        # Even number of elements: return average of two middle elements
-        median = (sorted_prices[length // 2 - 1] + sorted_prices[length // 2]) / 2
-
-    return round(median, 5)
-
-
-def _get_cheapest_hour(slots: list[dict[str, Any]]) -> datetime | None:
-    """Get start time of cheapest hour from slots (generic for today/tomorrow)."""
-    if not slots:
-        return None
-    # Filter slots that have a start field
-    slots_with_start = [s for s in slots if "start" in s]
-    if not slots_with_start:
-        return None
-    cheapest = min(slots_with_start, key=lambda s: s.get("total_price", float("inf")))
-    return cheapest.get("start")
-
-
-def _get_most_expensive_hour(slots: list[dict[str, Any]]) -> datetime | None:
-    """Get start time of most expensive hour from slots (generic for today/tomorrow)."""
-    if not slots:
-        return None
-    most_expensive = max(slots, key=lambda s: s.get("total_price", float("-inf")))
-    return most_expensive.get("start")
-
-
 # Wrapper functions for today
 def _get_today_min_price(data: dict[str, Any]) -> float | None:
     """Get minimum price for today."""
-    return _get_min_price(data.get("today_slots", []))
+    return get_price_stat(data, "today", "min")
 
 
 def _get_today_max_price(data: dict[str, Any]) -> float | None:
     """Get maximum price for today."""
-    return _get_max_price(data.get("today_slots", []))
+    return get_price_stat(data, "today", "max")
 
 
 def _get_today_avg_price(data: dict[str, Any]) -> float | None:
     """Get average price for today."""
-    return _get_avg_price(data.get("today_slots", []))
+    return get_price_stat(data, "today", "avg")
 
 
 def _get_today_median_price(data: dict[str, Any]) -> float | None:
     """Get median price for today."""
-    return _get_median_price(data.get("today_slots", []))
+    return get_price_stat(data, "today", "median")
 
 
 def _get_today_cheapest_hour(data: dict[str, Any]) -> datetime | None:
     """Get start time of cheapest hour today."""
-    return _get_cheapest_hour(data.get("today_slots", []))
+    return get_price_stat(data, "today", "cheapest_hour")
 
 
 def _get_today_most_expensive_hour(data: dict[str, Any]) -> datetime | None:
     """Get start time of most expensive hour today."""
-    return _get_most_expensive_hour(data.get("today_slots", []))
+    return get_price_stat(data, "today", "most_expensive_hour")
 
 
 def _get_today_cheapest_3h_block(data: dict[str, Any]) -> datetime | None:
     """Get start time of cheapest 3-hour block today."""
-    return get_cheapest_3h_block(data.get("today_slots", []))
+    return get_cheapest_block_start(data, "today", 3)
 
 
 # Wrapper functions for tomorrow
 def _get_tomorrow_min_price(data: dict[str, Any]) -> float | None:
     """Get minimum price for tomorrow."""
-    return _get_min_price(data.get("tomorrow_slots", []))
+    return get_price_stat(data, "tomorrow", "min")
 
 
 def _get_tomorrow_max_price(data: dict[str, Any]) -> float | None:
     """Get maximum price for tomorrow."""
-    return _get_max_price(data.get("tomorrow_slots", []))
+    return get_price_stat(data, "tomorrow", "max")
 
 
 def _get_tomorrow_avg_price(data: dict[str, Any]) -> float | None:
     """Get average price for tomorrow."""
-    return _get_avg_price(data.get("tomorrow_slots", []))
+    return get_price_stat(data, "tomorrow", "avg")
 
 
 def _get_tomorrow_median_price(data: dict[str, Any]) -> float | None:
     """Get median price for tomorrow."""
-    return _get_median_price(data.get("tomorrow_slots", []))
+    return get_price_stat(data, "tomorrow", "median")
 
 
 def _get_tomorrow_cheapest_hour(data: dict[str, Any]) -> datetime | None:
     """Get start time of cheapest hour tomorrow."""
-    return _get_cheapest_hour(data.get("tomorrow_slots", []))
+    return get_price_stat(data, "tomorrow", "cheapest_hour")
 
 
 def _get_tomorrow_most_expensive_hour(data: dict[str, Any]) -> datetime | None:
     """Get start time of most expensive hour tomorrow."""
-    return _get_most_expensive_hour(data.get("tomorrow_slots", []))
+    return get_price_stat(data, "tomorrow", "most_expensive_hour")
 
 
 def _get_tomorrow_cheapest_3h_block(data: dict[str, Any]) -> datetime | None:
     """Get start time of cheapest 3-hour block tomorrow."""
-    return get_cheapest_3h_block(data.get("tomorrow_slots", []))
+    return get_cheapest_block_start(data, "tomorrow", 3)
 
 
 def _get_price_now_attributes(data: dict[str, Any]) -> dict[str, Any]:
@@ -1,12 +1,30 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
+from operator import itemgetter
 from typing import Any
 
 from homeassistant.util import dt as dt_util
 
 from .const import LOGGER
 
+_get_total_price = itemgetter("total_price")
+
+# Keys of the per-day price statistics
+_PRICE_STATS = (
+    "min",
+    "max",
+    "avg",
+    "median",
+    "cheapest_hour",
+    "most_expensive_hour",
+)
+
+
+def _clamp_offset(offset_seconds: int) -> int:
+    """Clamp the update offset to the valid seconds range (0-59)."""
+    return 0 if offset_seconds < 0 else 59 if offset_seconds > 59 else offset_seconds
+
 
 def calculate_next_update_time(interval_minutes: int, offset_seconds: int) -> datetime:
     """Calculate the next update time based on interval and offset.
@@ -19,17 +37,26 @@ def calculate_next_update_time(interval_minutes: int, offset_seconds: int) -> da
         Next update time as datetime
     """
     # Cap offset_seconds to valid range (0-59) to prevent ValueError
-    offset_seconds = min(max(0, offset_seconds), 59)
+    offset_seconds = _clamp_offset(offset_seconds)
 
     now = dt_util.now()
     try:
-        minutes_past_hour = now.minute
+        # Work on plain wall-clock fields instead of replace() on the aware datetime
+        year, month, day, hour = now.year, now.month, now.day, now.hour
+        tz, fold = now.tzinfo, now.fold
 
         # Determine the current interval start time with the offset applied
-        interval_count = minutes_past_hour // interval_minutes
+        interval_count = now.minute // interval_minutes
         interval_start_minute = interval_count * interval_minutes
-        interval_start_time = now.replace(
-            minute=interval_start_minute, second=offset_seconds, microsecond=0
+        interval_start_time = datetime(
+            year,
+            month,
+            day,
+            hour,
+            interval_start_minute,
+            offset_seconds,
+            tzinfo=tz,
+            fold=fold,
         )
 
         if now < interval_start_time:
@@ -38,22 +65,23 @@ def calculate_next_update_time(interval_minutes: int, offset_seconds: int) -> da
             next_minute = interval_start_minute + interval_minutes
             if next_minute >= 60:
                 # Handle hour rollover explicitly
-                next_hour = now.hour + 1
-                if next_hour >= 24:
-                    # Handle day rollover: add one day and reset to midnight
-                    next_time = now.replace(
-                        hour=0, minute=0, second=offset_seconds, microsecond=0
-                    ) + timedelta(days=1)
-                else:
-                    next_time = now.replace(
-                        hour=next_hour,
-                        minute=0,
-                        second=offset_seconds,
-                        microsecond=0,
-                    )
+                hour += 1
+                next_minute = 0
+            if hour >= 24:
+                # Handle day rollover: add one day and reset to midnight
+                next_time = datetime(
+                    year, month, day, 0, 0, offset_seconds, tzinfo=tz, fold=fold
+                ) + timedelta(days=1)
             else:
-                next_time = now.replace(
-                    minute=next_minute, second=offset_seconds, microsecond=0
+                next_time = datetime(
+                    year,
+                    month,
+                    day,
+                    hour,
+                    next_minute,
+                    offset_seconds,
+                    tzinfo=tz,
+                    fold=fold,
                 )
 
         # Ensure we never schedule in the past (DST edge cases)
@@ -68,53 +96,151 @@ def calculate_next_update_time(interval_minutes: int, offset_seconds: int) -> da
         return now + timedelta(minutes=interval_minutes, seconds=offset_seconds)
 
 
-def get_cheapest_3h_block(slots: list[dict[str, Any]]) -> datetime | None:
-    """Get start time of cheapest 3-hour block from slots.
+def get_prices(slots: list[dict[str, Any]]) -> list[Any]:
+    """Extract total prices from slots in one pass.
+
+    Args:
+        slots: List of price slots with 'total_price' keys
+
+    Returns:
+        List of total prices, with 0 for slots missing the key or set to None
+    """
+    try:
+        # Coordinator slots always carry total_price
+        prices = list(map(_get_total_price, slots))
+    except KeyError:
+        prices = [s.get("total_price", 0) for s in slots]
+    if None in prices:
+        # Treat None values as 0
+        prices = [0 if p is None else p for p in prices]
+    return prices
+
+
+def get_price_stats(slots: list[dict[str, Any]]) -> dict[str, Any]:
+    """Get price statistics of slots from one extraction.
 
     Args:
         slots: List of price slots with 'start' and 'total_price' keys
 
     Returns:
-        Start datetime of cheapest 3-hour block, or None if not enough slots
+        Dictionary with 'min', 'max', 'avg' and 'median' prices rounded to
+        5 decimals and 'cheapest_hour' / 'most_expensive_hour' start times,
+        or None values if there are no slots
     """
-    if len(slots) < 3:
-        return None
+    if not slots:
+        return dict.fromkeys(_PRICE_STATS)
+
+    prices = get_prices(slots)
+    sorted_prices = sorted(prices)
+    length = len(sorted_prices)
+    middle = length // 2
+
+    if length % 2 == 1:
+        # Odd number of elements: middle element
+        median = sorted_prices[middle]
+    else:
+        # Even number of elements: average of two middle elements
+        median = (sorted_prices[middle - 1] + sorted_prices[middle]) / 2
+
+    # A slot without a price never wins an hour, and only slots with a
+    # start field can be reported as cheapest hour
+    priced = [s for s in slots if s.get("total_price") is not None]
+    cheapest = min(
+        (s for s in priced if "start" in s), key=_get_total_price, default=None
+    )
+    most_expensive = max(priced, key=_get_total_price, default=None)
+
+    return {
+        "min": round(sorted_prices[0], 5),
+        "max": round(sorted_prices[-1], 5),
+        "avg": round(sum(prices) / length, 5),
+        "median": round(median, 5),
+        "cheapest_hour": cheapest["start"] if cheapest is not None else None,
+        "most_expensive_hour": (
+            most_expensive.get("start") if most_expensive is not None else None
+        ),
+    }
+
+
+def get_price_stat(data: dict[str, Any], day: str, stat: str) -> Any:
+    """Get a price statistic for a day from coordinator data.
+
+    Uses the statistics precomputed by the price coordinator on each refresh
+    and only falls back to computing them from the slots if they are missing.
 
-    # Find the 3-hour block with lowest average price
-    min_avg = float("inf")
-    best_start = None
+    Args:
+        data: Price coordinator data
+        day: "today" or "tomorrow"
+        stat: One of the keys returned by get_price_stats
 
-    for i in range(len(slots) - 2):
-        block = slots[i : i + 3]
-        avg_price = sum(s.get("total_price", 0) for s in block) / 3
-        if avg_price < min_avg:
-            min_avg = avg_price
-            best_start = block[0].get("start")
+    Returns:
+        The statistic, or None if there are no slots
+    """
+    stats = data.get(f"{day}_price_stats")
+    if stats is None:
+        stats = get_price_stats(data.get(f"{day}_slots", []))
+    return stats[stat]
 
-    return best_start
 
+def get_cheapest_blocks(
+    slots: list[dict[str, Any]], ks: tuple[int, ...] = (3, 4)
+) -> dict[int, datetime | None]:
+    """Get start times of the cheapest blocks for several block lengths at once.
 
-def get_cheapest_4h_block(slots: list[dict[str, Any]]) -> datetime | None:
-    """Get start time of cheapest 4-hour block from slots.
+    Prices are extracted once and all requested block lengths are evaluated
+    in the same pass over the slots.
 
     Args:
         slots: List of price slots with 'start' and 'total_price' keys
+        ks: Block lengths in hours
 
     Returns:
-        Start datetime of cheapest 4-hour block, or None if not enough slots
+        Mapping of block length to the start datetime of its cheapest block,
+        or None for lengths with not enough slots
     """
-    if len(slots) < 4:
-        return None
+    if len(slots) < min(ks):
+        # Not enough slots for any block (e.g. tomorrow's prices not published yet)
+        return dict.fromkeys(ks)
+
+    prices = get_prices(slots)
+    count = len(prices)
+
+    # Find the block with lowest average price for every length
+    min_avg = dict.fromkeys(ks, float("inf"))
+    best_index: dict[int, int | None] = dict.fromkeys(ks)
+
+    for i in range(count):
+        for k in ks:
+            if i + k > count:
+                continue
+            avg_price = sum(prices[i : i + k]) / k
+            if avg_price < min_avg[k]:
+                min_avg[k] = avg_price
+                best_index[k] = i
 
-    # Find the 4-hour block with lowest average price
-    min_avg = float("inf")
-    best_start = None
+    return {
+        k: slots[index].get("start") if index is not None else None
+        for k, index in best_index.items()
+    }
 
-    for i in range(len(slots) - 3):
-        block = slots[i : i + 4]
-        avg_price = sum(s.get("total_price", 0) for s in block) / 4
-        if avg_price < min_avg:
-            min_avg = avg_price
-            best_start = block[0].get("start")
 
-    return best_start
+def get_cheapest_block_start(
+    data: dict[str, Any], day: str, hours: int
+) -> datetime | None:
+    """Get start time of the cheapest block for a day from coordinator data.
+
+    Uses the blocks precomputed by the price coordinator on each refresh and
+    only falls back to scanning the slots if they are missing.
+
+    Args:
+        data: Price coordinator data
+        day: "today" or "tomorrow"
+        hours: Block length in hours
+
+    Returns:
+        Start datetime of the cheapest block, or None if not enough slots
+    """
+    blocks = data.get(f"{day}_cheapest_blocks")
+    if blocks is not None and hours in blocks:
+        return blocks[hours]
+    return get_cheapest_blocks(data.get(f"{day}_slots", []), (hours,))[hours]
@@ -10,7 +10,6 @@ import warnings
 from typing import TYPE_CHECKING
 
 import pytest
-import pytest_socket
 
 if TYPE_CHECKING:
     from homeassistant.core import HassJob
@@ -32,6 +31,8 @@ warnings.filterwarnings(
 )
 
 if os.name == "nt":
+    import pytest_socket
+
     def _disable_socket_windows(*_args, **_kwargs) -> None:
         """Keep sockets enabled on Windows so asyncio can create the event loop."""
         pytest_socket.enable_socket()
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+from collections.abc import Generator
 from unittest.mock import AsyncMock, patch
 
+import pytest
 from homeassistant.core import HomeAssistant
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.ostrom_advanced import async_setup_entry
+from custom_components.ostrom_advanced import (
+    OstromPriceCoordinator,
+    async_setup_entry,
+)
 from custom_components.ostrom_advanced.const import (
     CONF_CLIENT_ID,
     CONF_CLIENT_SECRET,
@@ -27,39 +32,42 @@ TEST_ENTRY_DATA = {
 }
 
 
-async def test_async_setup_entry(hass: HomeAssistant) -> None:
-    """Verify async_setup_entry sets up the integration."""
-    entry = MockConfigEntry(domain=DOMAIN, data=TEST_ENTRY_DATA)
-    entry.add_to_hass(hass)
-
-    with patch(
-        "custom_components.ostrom_advanced.OstromPriceCoordinator.async_config_entry_first_refresh",
-        new=AsyncMock(),
+@pytest.fixture
+def mock_setup_calls(hass: HomeAssistant) -> Generator[None, None, None]:
+    """Skip the initial price fetch and platform forwarding during setup."""
+    with patch.object(
+        OstromPriceCoordinator,
+        "async_config_entry_first_refresh",
+        AsyncMock(),
     ), patch.object(
         hass.config_entries,
         "async_forward_entry_setups",
         AsyncMock(return_value=True),
     ):
-        result = await async_setup_entry(hass, entry)
+        yield
+
+
+async def test_async_setup_entry(
+    hass: HomeAssistant, mock_setup_calls: None
+) -> None:
+    """Verify async_setup_entry sets up the integration."""
+    entry = MockConfigEntry(domain=DOMAIN, data=TEST_ENTRY_DATA)
+    entry.add_to_hass(hass)
+
+    result = await async_setup_entry(hass, entry)
 
     assert result is True
     assert DOMAIN in hass.data
     assert entry.entry_id in hass.data[DOMAIN]
 
 
-async def test_config_entries_async_setup(hass: HomeAssistant) -> None:
+async def test_config_entries_async_setup(
+    hass: HomeAssistant, mock_setup_calls: None
+) -> None:
     """Verify hass.config_entries.async_setup returns True."""
     entry = MockConfigEntry(domain=DOMAIN, data=TEST_ENTRY_DATA)
     entry.add_to_hass(hass)
 
-    with patch(
-        "custom_components.ostrom_advanced.OstromPriceCoordinator.async_config_entry_first_refresh",
-        new=AsyncMock(),
-    ), patch.object(
-        hass.config_entries,
-        "async_forward_entry_setups",
-        AsyncMock(return_value=True),
-    ):
-        setup_result = await hass.config_entries.async_setup(entry.entry_id)
+    setup_result = await hass.config_entries.async_setup(entry.entry_id)
 
     assert setup_result is True
@@ -4,18 +4,25 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
+from typing import Any
+
+import pytest
 
 from custom_components.ostrom_advanced.const import DOMAIN
 
 
-def test_manifest_domain_matches_const() -> None:
-    """Verify manifest domain matches the integration domain."""
+@pytest.fixture(scope="module")
+def manifest() -> dict[str, Any]:
+    """Return the parsed integration manifest, read once per module."""
     manifest_path = (
         Path(__file__).resolve().parents[1]
         / "custom_components"
         / "ostrom_advanced"
         / "manifest.json"
     )
-    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    return json.loads(manifest_path.read_text(encoding="utf-8"))
 
+
+def test_manifest_domain_matches_const(manifest: dict[str, Any]) -> None:
+    """Verify manifest domain matches the integration domain."""
     assert manifest["domain"] == DOMAIN
@@ -0,0 +1,276 @@
+"""Tests for Ostrom Advanced price and scheduling helpers."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from custom_components.ostrom_advanced.utils import (
+    calculate_next_update_time,
+    get_cheapest_block_start,
+    get_cheapest_blocks,
+    get_price_stat,
+    get_price_stats,
+)
+
+TZ = ZoneInfo("Europe/Berlin")
+UTC = ZoneInfo("UTC")
+DAY_START = datetime(2025, 3, 10, tzinfo=TZ)
+
+
+def _make_slots(prices: list[float]) -> list[dict]:
+    """Build hourly price slots starting at midnight."""
+    return [
+        {"start": DAY_START + timedelta(hours=i), "total_price": price}
+        for i, price in enumerate(prices)
+    ]
+
+
+@pytest.mark.parametrize(
+    ("now", "interval", "offset", "expected"),
+    [
+        # Before the offset of the current interval
+        (
+            datetime(2025, 3, 10, 12, 15, 2, tzinfo=TZ),
+            15,
+            5,
+            datetime(2025, 3, 10, 12, 15, 5, tzinfo=TZ),
+        ),
+        # Next interval within the hour
+        (
+            datetime(2025, 3, 10, 12, 16, 0, tzinfo=TZ),
+            15,
+            5,
+            datetime(2025, 3, 10, 12, 30, 5, tzinfo=TZ),
+        ),
+        # Hour rollover
+        (
+            datetime(2025, 3, 10, 12, 50, 0, tzinfo=TZ),
+            15,
+            5,
+            datetime(2025, 3, 10, 13, 0, 5, tzinfo=TZ),
+        ),
+        # Interval that does not divide the hour
+        (
+            datetime(2025, 3, 10, 12, 58, 0, tzinfo=TZ),
+            7,
+            0,
+            datetime(2025, 3, 10, 13, 0, 0, tzinfo=TZ),
+        ),
+        # Day rollover
+        (
+            datetime(2025, 3, 10, 23, 59, 30, tzinfo=TZ),
+            60,
+            10,
+            datetime(2025, 3, 11, 0, 0, 10, tzinfo=TZ),
+        ),
+        # Month and year rollover
+        (
+            datetime(2025, 12, 31, 23, 45, 0, tzinfo=TZ),
+            15,
+            0,
+            datetime(2026, 1, 1, 0, 0, 0, tzinfo=TZ),
+        ),
+        # Offset is clamped to 0-59
+        (
+            datetime(2025, 3, 10, 12, 16, 0, tzinfo=TZ),
+            15,
+            90,
+            datetime(2025, 3, 10, 12, 30, 59, tzinfo=TZ),
+        ),
+        (
+            datetime(2025, 3, 10, 12, 16, 0, tzinfo=TZ),
+            15,
+            -5,
+            datetime(2025, 3, 10, 12, 30, 0, tzinfo=TZ),
+        ),
+    ],
+)
+def test_calculate_next_update_time(
+    now: datetime, interval: int, offset: int, expected: datetime
+) -> None:
+    """Verify the next update time including hour and day rollover."""
+    with patch(
+        "custom_components.ostrom_advanced.utils.dt_util.now", return_value=now
+    ):
+        next_time = calculate_next_update_time(interval, offset)
+
+    assert next_time == expected
+    assert next_time > now
+
+
+def test_calculate_next_update_time_dst_fall_back() -> None:
+    """Verify the repeated hour at the end of DST is scheduled in the future."""
+    # 02:50 CET, the second occurrence of 02:50 on 2025-10-26
+    now = datetime(2025, 10, 26, 1, 50, tzinfo=UTC).astimezone(TZ)
+    assert now.fold == 1
+
+    with patch(
+        "custom_components.ostrom_advanced.utils.dt_util.now", return_value=now
+    ):
+        next_time = calculate_next_update_time(5, 0)
+
+    # 02:55 CET must keep the fold, 02:55 CEST would lie in the past
+    assert next_time.astimezone(UTC) == datetime(2025, 10, 26, 1, 55, tzinfo=UTC)
+
+
+@pytest.mark.parametrize(
+    "prices",
+    [
+        [0.30, 0.25, 0.20, 0.15, 0.10, 0.12, 0.18, 0.22, 0.28],
+        # Ties: several windows share the lowest average, the first must win
+        [0.20, 0.10, 0.10, 0.10, 0.20, 0.10, 0.10, 0.10, 0.20],
+        [0.25] * 24,
+        [0.30, 0.10, 0.10, 0.10],
+    ],
+)
+def test_cheapest_blocks_match_window_sums(prices: list[float]) -> None:
+    """Verify both block lengths from one call match a brute-force search."""
+    slots = _make_slots(prices)
+
+    blocks = get_cheapest_blocks(slots, (3, 4))
+
+    for k in (3, 4):
+        sums = [sum(prices[i : i + k]) for i in range(len(prices) - k + 1)]
+        assert blocks[k] == slots[sums.index(min(sums))]["start"]
+
+
+def test_cheapest_blocks_ties_pick_earliest() -> None:
+    """Verify the earliest block wins when averages are equal."""
+    slots = _make_slots([0.20, 0.10, 0.10, 0.10, 0.20, 0.10, 0.10, 0.10])
+
+    blocks = get_cheapest_blocks(slots, (3, 4))
+
+    assert blocks[3] == DAY_START + timedelta(hours=1)
+    assert blocks[4] == DAY_START
+
+
+@pytest.mark.parametrize("count", [0, 1, 2])
+def test_cheapest_blocks_too_few_slots(count: int) -> None:
+    """Verify no block is returned with fewer than 3 slots."""
+    slots = _make_slots([0.10] * count)
+
+    assert get_cheapest_blocks(slots, (3, 4)) == {3: None, 4: None}
+
+
+def test_cheapest_blocks_only_shorter_length_fits() -> None:
+    """Verify a 3h block is found when there are only 3 slots."""
+    slots = _make_slots([0.30, 0.20, 0.10])
+
+    assert get_cheapest_blocks(slots, (3, 4)) == {3: DAY_START, 4: None}
+
+
+def test_cheapest_block_start_uses_precomputed_or_slots() -> None:
+    """Verify precomputed blocks are used and slots are the fallback."""
+    slots = _make_slots([0.30, 0.20, 0.10, 0.10, 0.10])
+    precomputed = DAY_START + timedelta(hours=5)
+    data = {"today_slots": slots, "today_cheapest_blocks": {3: precomputed}}
+
+    assert get_cheapest_block_start(data, "today", 3) == precomputed
+    # Length not precomputed: scan the slots
+    assert get_cheapest_block_start(data, "today", 4) == DAY_START + timedelta(
+        hours=1
+    )
+    assert get_cheapest_block_start({"tomorrow_slots": slots}, "tomorrow", 3) == (
+        DAY_START + timedelta(hours=2)
+    )
+    assert get_cheapest_block_start({}, "tomorrow", 3) is None
+
+
+def test_cheapest_blocks_missing_or_none_price() -> None:
+    """Verify missing and None prices count as 0 instead of failing."""
+    slots = _make_slots([0.30, 0.30, 0.30, 0.30, 0.30, 0.30])
+    del slots[3]["total_price"]
+    slots[4]["total_price"] = None
+
+    blocks = get_cheapest_blocks(slots, (3, 4))
+
+    assert blocks[3] == DAY_START + timedelta(hours=2)
+    assert blocks[4] == DAY_START + timedelta(hours=1)
+
+
+def test_price_stats_odd_count() -> None:
+    """Verify statistics for an odd number of slots."""
+    slots = _make_slots([0.30, 0.10, 0.20])
+
+    assert get_price_stats(slots) == {
+        "min": 0.1,
+        "max": 0.3,
+        "avg": 0.2,
+        "median": 0.2,
+        "cheapest_hour": DAY_START + timedelta(hours=1),
+        "most_expensive_hour": DAY_START,
+    }
+
+
+def test_price_stats_even_count() -> None:
+    """Verify the median averages the two middle prices."""
+    slots = _make_slots([0.40, 0.10, 0.20, 0.30])
+
+    stats = get_price_stats(slots)
+
+    assert stats["median"] == 0.25
+    assert stats["avg"] == 0.25
+    assert stats["cheapest_hour"] == DAY_START + timedelta(hours=1)
+    assert stats["most_expensive_hour"] == DAY_START
+
+
+def test_price_stats_missing_fields() -> None:
+    """Verify slots without start or total_price are handled."""
+    slots = _make_slots([0.30, 0.20, 0.40, 0.10])
+    del slots[2]["total_price"]
+    del slots[3]["start"]
+
+    stats = get_price_stats(slots)
+
+    # The missing price counts as 0 but never wins an hour
+    assert stats["min"] == 0
+    assert stats["max"] == 0.3
+    assert stats["median"] == 0.15
+    assert stats["cheapest_hour"] == DAY_START + timedelta(hours=1)
+    assert stats["most_expensive_hour"] == DAY_START
+
+
+def test_price_stats_none_price_never_wins_an_hour() -> None:
+    """Verify a None price counts as 0 but is never the cheapest hour."""
+    slots = _make_slots([0.30, None, 0.20])
+
+    stats = get_price_stats(slots)
+
+    assert stats["min"] == 0
+    assert stats["cheapest_hour"] == DAY_START + timedelta(hours=2)
+    assert stats["most_expensive_hour"] == DAY_START
+
+    # With negative prices the None slot is not the most expensive either
+    slots = _make_slots([-0.30, None, -0.20])
+
+    stats = get_price_stats(slots)
+
+    assert stats["max"] == 0
+    assert stats["most_expensive_hour"] == DAY_START + timedelta(hours=2)
+
+
+def test_price_stats_no_slot_with_start() -> None:
+    """Verify no cheapest hour is reported when no slot has a start."""
+    stats = get_price_stats([{"total_price": 0.2}, {"total_price": 0.1}])
+
+    assert stats["min"] == 0.1
+    assert stats["cheapest_hour"] is None
+    assert stats["most_expensive_hour"] is None
+
+
+def test_price_stats_empty() -> None:
+    """Verify all statistics are None without slots."""
+    assert set(get_price_stats([]).values()) == {None}
+
+
+def test_price_stat_uses_precomputed_or_slots() -> None:
+    """Verify precomputed statistics are used and slots are the fallback."""
+    slots = _make_slots([0.30, 0.10, 0.20])
+
+    assert get_price_stat({"today_price_stats": {"min": 1.5}}, "today", "min") == 1.5
+    assert get_price_stat({"tomorrow_slots": slots}, "tomorrow", "min") == 0.1
+    assert get_price_stat({}, "tomorrow", "min") is None